@@ -1,9 +1,90 @@
 import pygame
 import math
 
+# Bullet angles are snapped to this many degrees so rotated sprites can be reused
+ANGLE_STEP = 3
+ANGLE_BUCKETS = 360 // ANGLE_STEP
+
+# Which side fired a bullet; also indexes per-team collision data in Game
+PLAYER_TEAM = 0
+ENEMY_TEAM = 1
+
+_sqrt = math.sqrt
+_ceil = math.ceil
+
+# Unrotated bullet surfaces, keyed by (size, color)
+_BASE_SURF_CACHE = {}
+
+# Pre-rotated sprites per bullet look, keyed by (size, color), one entry per angle bucket
+_ROTATION_ATLAS = {}
+
+
+def get_base_surface(size, color):
+    """
+    Return the shared unrotated surface for a bullet of the given look.
+
+    Args:
+        size (tuple): Width and height of the bullet
+        color (tuple): RGB color value as (R, G, B)
+    """
+    key = (size, color)
+    surface = _BASE_SURF_CACHE.get(key)
+    if surface is None:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, color, (0, 0, *size))
+        _BASE_SURF_CACHE[key] = surface
+    return surface
+
+
+def angle_bucket(direction):
+    """
+    Convert a direction vector to the index of its nearest ANGLE_STEP rotation.
+
+    Args:
+        direction (tuple): Direction vector (dx, dy)
+    """
+    angle = math.degrees(math.atan2(-direction[1], direction[0]))
+    return int(round(angle / ANGLE_STEP)) % ANGLE_BUCKETS
+
+
+def get_rotated_sprites(size, color):
+    """
+    Return every rotation of a bullet of the given look, rendered on first use.
+    Each entry is (surface, half width, half height), indexed by angle bucket.
+    Sprites are converted to the display's pixel format when a display exists,
+    so blitting them needs no per-call conversion.
+
+    Args:
+        size (tuple): Width and height of the bullet
+        color (tuple): RGB color value as (R, G, B)
+    """
+    key = (size, color)
+    sprites = _ROTATION_ATLAS.get(key)
+    if sprites is None:
+        base_surface = get_base_surface(size, color)
+        # convert_alpha() needs a display mode; spawning happens in-game, after set_mode
+        convert = pygame.display.get_surface() is not None
+        sprites = []
+        for bucket in range(ANGLE_BUCKETS):
+            surface = pygame.transform.rotate(base_surface, bucket * ANGLE_STEP)
+            if convert:
+                surface = surface.convert_alpha()
+            sprites.append((surface, surface.get_width() / 2, surface.get_height() / 2))
+        _ROTATION_ATLAS[key] = sprites
+    return sprites
+
 
 class Bullet:
-    def __init__(self, x, y, direction, speed, size, color, max_distance):
+    __slots__ = (
+        'x', 'y', 'start_x', 'start_y', 'direction', 'speed', 'vx', 'vy',
+        'width', 'height', 'color', 'sprite', 'half_sprite_width', 'half_sprite_height',
+        'active', 'max_distance', 'frames_left', 'team'
+    )
+
+    # Released bullets waiting to be reused by spawn()
+    _pool = []
+
+    def __init__(self, x, y, direction, speed, size, color, max_distance, team):
         """
         Create a bullet here
 
@@ -15,6 +96,31 @@ class Bullet:
             size (tuple): Width and height of the bullet
             color (tuple): RGB color value as (R, G, B)
             max_distance (float): Maximum travel distance for the bullet
+            team (int): PLAYER_TEAM or ENEMY_TEAM, the side that fired it
+        """
+        self.reset(x, y, direction, speed, size, color, max_distance, team)
+
+    @classmethod
+    def spawn(cls, x, y, direction, speed, size, color, max_distance, team):
+        """
+        Take a bullet from the pool and reset it, or create one if the pool is empty.
+        Takes the same arguments as the constructor.
+        """
+        if cls._pool:
+            bullet = cls._pool.pop()
+            bullet.reset(x, y, direction, speed, size, color, max_distance, team)
+            return bullet
+        return cls(x, y, direction, speed, size, color, max_distance, team)
+
+    def release(self):
+        """Return the bullet to the pool once it is out of play."""
+        self.active = False
+        Bullet._pool.append(self)
+
+    def reset(self, x, y, direction, speed, size, color, max_distance, team):
+        """
+        (Re)initialize every field for a new shot.
+        Takes the same arguments as the constructor.
         """
         self.x = x
         self.y = y
@@ -22,64 +128,58 @@ class Bullet:
         self.start_y = y
         self.direction = direction
         self.speed = speed
+        # Per-frame velocity, fixed for the bullet's lifetime
+        self.vx = direction[0] * speed
+        self.vy = direction[1] * speed
         self.width, self.height = size
         self.color = color
+
+        # Rotated sprite and its centering offsets, fixed since the direction never changes
+        self.sprite, self.half_sprite_width, self.half_sprite_height = \
+            get_rotated_sprites(size, color)[angle_bucket(direction)]
         self.active = True
         self.max_distance = max_distance
-        self.distance_traveled = 0
+        # Direction is unit length, so the bullet covers exactly speed pixels a
+        # frame and its range is reached after a fixed number of frames
+        self.frames_left = _ceil(max_distance / speed)
+        self.team = team
+
+    @property
+    def distance_traveled(self):
+        """Distance from the starting position, computed on demand."""
+        dx = self.x - self.start_x
+        dy = self.y - self.start_y
+        return _sqrt(dx * dx + dy * dy)
+
+    def get_blit_args(self):
+        """Return the (surface, destination) pair that draws this bullet."""
+        return self.sprite, (self.x - self.half_sprite_width, self.y - self.half_sprite_height)
 
     def update(self, screen_width, screen_height):
         """
         Update bullet position.
+        Returns whether the bullet is still active.
 
         Args:
             screen_width (int): Width of the game screen
             screen_height (int): Height of the game screen
         """
         # Move the bullet
-        self.x += self.direction[0] * self.speed
-        self.y += self.direction[1] * self.speed
-
-        # Calculate distance traveled
-        dx = self.x - self.start_x
-        dy = self.y - self.start_y
-        self.distance_traveled = math.sqrt(dx * dx + dy * dy)
+        x = self.x + self.vx
+        y = self.y + self.vy
+        self.x = x
+        self.y = y
 
-        # Check if bullet has traveled its maximum distance
-        if self.distance_traveled >= self.max_distance:
-            self.active = False
-            return
+        # Count down the frames until the maximum distance is reached
+        frames_left = self.frames_left - 1
+        self.frames_left = frames_left
 
-        # Check if bullet is off-screen
-        if (self.x < -self.width or self.x > screen_width + self.width or
-                self.y < -self.height or self.y > screen_height + self.height):
+        # Deactivate once the bullet has traveled its maximum distance or left
+        # the screen, checked in one pass over the fresh position
+        width = self.width
+        height = self.height
+        if (frames_left <= 0 or
+                not (-width <= x <= screen_width + width and
+                     -height <= y <= screen_height + height)):
             self.active = False
-
-    def draw(self, screen):
-        """
-        Draw the bullet on the screen.
-
-        Args:
-            screen: Pygame surface to draw on
-        """
-        # Calculate the rectangle for the bullet
-        rect = pygame.Rect(
-            self.x - self.width / 2,
-            self.y - self.height / 2,
-            self.width,
-            self.height
-        )
-
-        # Rotate the bullet to match dir
-        angle = math.degrees(math.atan2(-self.direction[1], self.direction[0]))
-
-        # Create a surface for the rotated bullet
-        bullet_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        pygame.draw.rect(bullet_surface, self.color, (0, 0, self.width, self.height))
-
-        # Rotate the surface
-        rotated_surface = pygame.transform.rotate(bullet_surface, angle)
-        rotated_rect = rotated_surface.get_rect(center=(self.x, self.y))
-
-        # Draw the rotated bullet
-        screen.blit(rotated_surface, rotated_rect)
\ No newline at end of file
+        return self.active
@@ -2,10 +2,20 @@ import pygame
 import math
 import random
 from collections import deque
-from bullet import Bullet
+from bullet import Bullet, ENEMY_TEAM
 
 
 class Enemy:
+    __slots__ = (
+        'x', 'y', 'radius', 'color', 'speed', 'aim_direction', '_last_aim_key',
+        'shooting', 'bullets_to_fire', 'bullet_queue', '_shot_frame',
+        'max_ammo', 'ammo', 'ammo_recharge_rate', 'is_recharging', '_total_ammo', '_has_full',
+        'max_health', 'health',
+        'target', 'attack_range', 'indicator_length', 'attack_cooldown', 'min_attack_cooldown',
+        'bullet_count', 'bullet_delay', 'bullet_speed', 'bullet_size', 'bullet_color',
+        'bullet_spread', 'column_offset', '_stagger'
+    )
+
     def __init__(self, x, y, radius, color, speed):
         """
         Initialize the enemy.
@@ -23,17 +33,21 @@ class Enemy:
         self.color = color
         self.speed = speed
         self.aim_direction = (1, 0)  # Default direction (right)
+        self._last_aim_key = None  # (target x, target y, x, y) aim was last computed for
 
         # Shooting properties
         self.shooting = False
         self.bullets_to_fire = 0
-        self.bullet_queue = deque()
+        self.bullet_queue = deque()  # (fire frame, direction, offset x, offset y), in firing order
+        self._shot_frame = 0  # Frames since the current burst started
 
         # Ammo System
         self.max_ammo = 3
         self.ammo = [1.0, 1.0, 1.0]  # Start with full ammo
         self.ammo_recharge_rate = 0.01  # Amount recharged per frame
         self.is_recharging = True
+        self._total_ammo = sum(self.ammo)  # Running total, kept in sync with self.ammo
+        self._has_full = True  # Whether any segment is fully charged
 
         # Health System
         self.max_health = 100
@@ -53,28 +67,39 @@ class Enemy:
         self.bullet_speed = 10  # Speed of bullets
         self.bullet_size = (20, 8)  # Size of bullets (width, height)
         self.bullet_color = (0, 255, 0)  # Bullet color (green)
-        self.bullet_spread = 0  # Random spread factor (0 = no spread, higher = more spread)
+        self.bullet_spread = 0  # Random spread factor, sine of the max spread angle (0 = no spread, 1 = up to 90 degrees)
         self.column_offset = 15  # Distance between left and right columns
 
         # Store the indicator length for bullet max distance
         self.indicator_length = 500
 
+        # Burst pattern as (column offset factor, fire delay) per bullet, creating a
+        # staggered pattern in two columns like Colt in Brawlstars: even indices go
+        # to the left column, odd to the right one, half a delay later
+        self._stagger = tuple(
+            (-0.5, self.bullet_delay * (i // 2)) if i % 2 == 0
+            else (0.5, self.bullet_delay * (i // 2) + self.bullet_delay // 2)
+            for i in range(self.bullet_count)
+        )
+
     def move_towards_target(self, screen_width, screen_height):
         """Move towards the target if it exists and is out of range."""
         if not self.target:
             return 0, 0  # No movement if no target
 
-        # Calculate distance to target
+        # Calculate squared distance to target
         dx = self.target.x - self.x
         dy = self.target.y - self.y
-        distance = math.sqrt(dx * dx + dy * dy)
+        distance_sq = dx * dx + dy * dy
+        range_eff = self.attack_range - self.radius - self.target.radius
 
         # If target is out of range, move towards it
-        if distance > self.attack_range - self.radius - self.target.radius:
+        if distance_sq > range_eff * range_eff:
             # Normalize direction
-            if distance > 0:
-                dx /= distance
-                dy /= distance
+            if distance_sq > 0:
+                inv_distance = 1.0 / math.sqrt(distance_sq)
+                dx *= inv_distance
+                dy *= inv_distance
 
             # Calculate movement
             move_x = dx * self.speed
@@ -111,21 +136,25 @@ class Enemy:
         if not self.target:
             return
 
+        # Skip the recomputation if neither the enemy nor the target moved
+        aim_key = (self.target.x, self.target.y, self.x, self.y)
+        if aim_key == self._last_aim_key:
+            return
+        self._last_aim_key = aim_key
+
         # Calculate direction vector from enemy to target
         dx = self.target.x - self.x
         dy = self.target.y - self.y
 
         # Normalize the direction vector
-        length = math.sqrt(dx ** 2 + dy ** 2)
+        length = math.hypot(dx, dy)
         if length > 0:  # Avoid division by zero
-            self.aim_direction = (dx / length, dy / length)
+            inv_length = 1.0 / length
+            self.aim_direction = (dx * inv_length, dy * inv_length)
 
     def has_ammo(self):
         """Check if enemy has any ammo available."""
-        for ammo in self.ammo:
-            if ammo >= 1.0:
-                return True
-        return False
+        return self._has_full
 
     def consume_ammo(self):
         """
@@ -133,8 +162,7 @@ class Enemy:
         Returns True if successful, False if no ammo.
         """
         # Check if we have enough ammo to shoot (at least one full segment)
-        total_ammo = sum(self.ammo)
-        if total_ammo < 1.0:
+        if self._total_ammo < 1.0:
             return False
 
         # Find rightmost ammo with any charge
@@ -150,6 +178,7 @@ class Enemy:
         # If the rightmost ammo is full, just consume it
         if self.ammo[rightmost_index] >= 1.0:
             self.ammo[rightmost_index] = 0.0
+            self._sync_ammo_state()
             return True
 
         # Otherwise, we need to consume from multiple segments
@@ -169,8 +198,14 @@ class Enemy:
                     remaining_to_consume -= self.ammo[i]
                     self.ammo[i] = 0.0
 
+        self._sync_ammo_state()
         return True
 
+    def _sync_ammo_state(self):
+        """Recompute the cached ammo total and full-segment flag from self.ammo."""
+        self._total_ammo = sum(self.ammo)
+        self._has_full = any(ammo >= 1.0 for ammo in self.ammo)
+
     def update_ammo(self):
         """Update ammo recharge."""
         if not self.is_recharging:
@@ -179,9 +214,12 @@ class Enemy:
         # Recharge ammo sequentially (left to right)
         for i in range(len(self.ammo)):
             if self.ammo[i] < 1.0:
+                old_ammo = self.ammo[i]
                 self.ammo[i] += self.ammo_recharge_rate
-                if self.ammo[i] > 1.0:
+                if self.ammo[i] >= 1.0:
                     self.ammo[i] = 1.0
+                    self._has_full = True
+                self._total_ammo += self.ammo[i] - old_ammo
                 break  # Only recharge one slot at a time
 
     def can_attack_target(self):
@@ -189,13 +227,13 @@ class Enemy:
         if not self.target or self.shooting or not self.has_ammo():
             return False
 
-        # Calculate distance to target
+        # Calculate squared distance to target
         dx = self.target.x - self.x
         dy = self.target.y - self.y
-        distance = math.sqrt(dx * dx + dy * dy)
+        range_eff = self.attack_range - self.radius - self.target.radius
 
         # Check if target is in range and cooldown is over
-        return (distance <= self.attack_range - self.radius - self.target.radius and
+        return (dx * dx + dy * dy <= range_eff * range_eff and
                 self.attack_cooldown <= 0)
 
     def start_shooting(self):
@@ -212,39 +250,39 @@ class Enemy:
         self.bullets_to_fire = self.bullet_count
         self.is_recharging = False  # Stop recharging while shooting
         self.attack_cooldown = self.min_attack_cooldown  # Set cooldown
+        self._shot_frame = 0
 
         # Calculate perpendicular vector for column positioning
-        perp_x = -self.aim_direction[1]
-        perp_y = self.aim_direction[0]
-
-        # Pre-calculate all bullet directions for consistent trajectory
-        # Creating a staggered pattern in two columns like Colt in Brawlstars
-        for i in range(self.bullet_count):
-            # Apply random spread to direction
-            spread_x = random.uniform(-self.bullet_spread, self.bullet_spread)
-            spread_y = random.uniform(-self.bullet_spread, self.bullet_spread)
+        aim_x, aim_y = self.aim_direction
+        perp_x = -aim_y
+        perp_y = aim_x
 
-            # Normalize the direction vector after adding spread
-            dir_x = self.aim_direction[0] + spread_x
-            dir_y = self.aim_direction[1] + spread_y
-            length = math.sqrt(dir_x ** 2 + dir_y ** 2)
-            bullet_dir = (dir_x / length, dir_y / length)
+        # Spread is applied as a rotation of the aim direction, which keeps
+        # every bullet direction unit length without renormalizing
+        max_angle = math.asin(min(self.bullet_spread, 1.0))
+        angle_range = 2.0 * max_angle
+        rand = random.random
 
-            # Determine if this bullet is in the left or right column (alternating)
-            is_left_column = (i % 2 == 0)
+        # Pre-calculate all bullet directions for consistent trajectory
+        column_offset = self.column_offset
+        for offset_factor, column_delay in self._stagger:
+            # Apply random spread to direction; without spread every bullet
+            # simply follows the aim
+            if max_angle:
+                angle = rand() * angle_range - max_angle
+                cos_a = math.cos(angle)
+                sin_a = math.sin(angle)
+                bullet_dir = (aim_x * cos_a - aim_y * sin_a, aim_x * sin_a + aim_y * cos_a)
+            else:
+                bullet_dir = self.aim_direction
 
             # Calculate offset based on column
-            offset_factor = -0.5 if is_left_column else 0.5
-            offset_x = perp_x * self.column_offset * offset_factor
-            offset_y = perp_y * self.column_offset * offset_factor
+            offset_x = perp_x * column_offset * offset_factor
+            offset_y = perp_y * column_offset * offset_factor
 
-            # Calculate delay: stagger left and right columns
-            column_delay = self.bullet_delay * (i // 2)  # Integer division to group by pairs
-            if not is_left_column:
-                column_delay += self.bullet_delay // 2  # Half delay offset for right column
-
-            # Add to queue with position offset and delay counter
-            self.bullet_queue.append((bullet_dir, column_delay, offset_x, offset_y))
+            # Add to queue with the burst frame it fires on and its position offset.
+            # Delays never decrease along the burst, so the queue stays in firing order
+            self.bullet_queue.append((column_delay, bullet_dir, offset_x, offset_y))
 
     def update_shooting(self, bullets, screen_width, screen_height):
         """
@@ -255,37 +293,36 @@ class Enemy:
             screen_width (int): Width of the game screen
             screen_height (int): Height of the game screen
         """
-        # Process bullet queue
-        to_remove = []
-        for i, (bullet_dir, delay, offset_x, offset_y) in enumerate(self.bullet_queue):
-            if delay <= 0:
-                # Create the bullet with column offset
-                start_x = self.x + offset_x
-                start_y = self.y + offset_y
-
-                new_bullet = Bullet(
-                    start_x,
-                    start_y,
-                    bullet_dir,
-                    self.bullet_speed,
-                    self.bullet_size,
-                    self.bullet_color,
-                    self.indicator_length  # Pass the max distance to match indicator length
-                )
-                bullets.append(new_bullet)
-                to_remove.append(i)
-            else:
-                # Decrease delay counter
-                self.bullet_queue[i] = (bullet_dir, delay - 1, offset_x, offset_y)
-
-        # Remove processed bullets from queue
-        queue_list = list(self.bullet_queue)
-        for i in sorted(to_remove, reverse=True):
-            queue_list.pop(i)
-        self.bullet_queue = deque(queue_list)
+        # Bind hot attributes and methods to locals for the loop
+        queue = self.bullet_queue
+        queue_popleft = queue.popleft
+        bullets_append = bullets.append
+        frame = self._shot_frame
+        x = self.x
+        y = self.y
+
+        # Fire every queued bullet whose frame has come; the rest of the queue
+        # is untouched since it is ordered by fire frame
+        while queue and queue[0][0] <= frame:
+            _, bullet_dir, offset_x, offset_y = queue_popleft()
+
+            # Create the bullet with column offset
+            new_bullet = Bullet.spawn(
+                x + offset_x,
+                y + offset_y,
+                bullet_dir,
+                self.bullet_speed,
+                self.bullet_size,
+                self.bullet_color,
+                self.indicator_length,  # Pass the max distance to match indicator length
+                ENEMY_TEAM
+            )
+            bullets_append(new_bullet)
+
+        self._shot_frame = frame + 1
 
         # Check if shooting is complete
-        if len(self.bullet_queue) == 0:
+        if not queue:
             self.shooting = False
             self.is_recharging = True  # Start recharging again
 
@@ -318,19 +355,23 @@ class Enemy:
     def draw(self, screen):
         """
         Draw the enemy on the screen.
+        Returns the bounding rect of everything drawn.
 
         Args:
             screen: Pygame surface to draw on
         """
         # Draw the enemy circle
-        pygame.draw.circle(screen, self.color, (self.x, self.y), self.radius)
+        dirty = pygame.draw.circle(screen, self.color, (self.x, self.y), self.radius)
 
         # Draw health bar
-        self.draw_health_bar(screen)
+        dirty.union_ip(self.draw_health_bar(screen))
+
+        return dirty
 
     def draw_health_bar(self, screen):
         """
         Draw health bar above the enemy.
+        Returns the bar's rect.
 
         Args:
             screen: Pygame surface to draw on
@@ -349,9 +390,11 @@ class Enemy:
         bar_y = self.y - self.radius - bar_offset_y
 
         # Draw background
-        pygame.draw.rect(screen, background_color, (bar_x, bar_y, bar_width, bar_height))
+        bar_rect = pygame.draw.rect(screen, background_color, (bar_x, bar_y, bar_width, bar_height))
 
         # Draw filled portion based on health percentage
         health_width = int(bar_width * (self.health / self.max_health))
         if health_width > 0:
-            pygame.draw.rect(screen, health_color, (bar_x, bar_y, health_width, bar_height))
\ No newline at end of file
+            pygame.draw.rect(screen, health_color, (bar_x, bar_y, health_width, bar_height))
+
+        return bar_rect
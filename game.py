@@ -1,8 +1,27 @@
 import pygame
 import sys
+import gc
 import random
 from player import Player
 from enemy import Enemy
+from bullet import PLAYER_TEAM, ENEMY_TEAM
+from grid import UniformGrid
+
+# How bullet collisions find their candidate targets: 'brute' tests every
+# opposing entity, 'grid' uses the uniform grid broad-phase, and 'auto' only
+# switches to the grid once there are enough bullets for it to pay off
+COLLISION_BACKEND = 'auto'
+GRID_MIN_BULLETS = 128
+
+# pygame names used every frame, bound once instead of walked each lookup
+_K_W, _K_S, _K_A, _K_D = pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d
+_QUIT = pygame.QUIT
+_VIDEOEXPOSE = pygame.VIDEOEXPOSE
+_MOUSEBUTTONDOWN = pygame.MOUSEBUTTONDOWN
+_MOUSEBUTTONUP = pygame.MOUSEBUTTONUP
+_get_pressed = pygame.key.get_pressed
+_event_get = pygame.event.get
+_mouse_pos = pygame.mouse.get_pos
 
 
 class Game:
@@ -28,10 +47,22 @@ class Game:
         self.font = pygame.font.SysFont('Arial', 24)
         self.big_font = pygame.font.SysFont('Arial', 72)
 
+        # Text never changes, so rasterize it once
+        self._hit_surf = self.font.render("Hit!", True, (255, 0, 0))
+        self._go_surf = self.big_font.render("GAME OVER", True, (255, 0, 0))
+        self._try_surf = self.font.render("Try Again", True, (255, 255, 255))
+        self._quit_surf = self.font.render("Quit", True, (255, 255, 255))
+
         # Set up clock for controlling frame rate
         self.clock = pygame.time.Clock()
         self.fps = 60
 
+        # Largest share of the window that is still updated through dirty rects
+        self.dirty_area_fraction = 0.25
+
+        # Collision grids per team that fired, cells about twice the largest entity radius
+        self._grids = (UniformGrid(width, height, 60), UniformGrid(width, height, 60))
+
         # Initialize game
         self.init_game()
 
@@ -61,9 +92,8 @@ class Game:
         # Set target for enemy to player
         self.enemy.target = self.player
 
-        # Initialize bullets lists
-        self.player_bullets = []
-        self.enemy_bullets = []
+        # Initialize bullets list, shared by both teams
+        self.bullets = []
 
         # Game state
         self.running = True
@@ -73,6 +103,13 @@ class Game:
         self.player_bullet_damage = 10
         self.enemy_bullet_damage = 1
 
+        # Screen areas drawn last frame and their total area; None forces a full redraw
+        self._last_rects = None
+        self._last_area = 0
+
+        # The game over screen is static, so it is only drawn once
+        self._game_over_drawn = False
+
         # Hit notification
         self.show_hit_notification = False
         self.hit_notification_timer = 0
@@ -80,27 +117,32 @@ class Game:
 
     def handle_events(self):
         """Handle pygame events like quit and keypresses."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for event in _event_get():
+            event_type = event.type
+            if event_type == _QUIT:
                 self.running = False
-            elif event.type == pygame.MOUSEBUTTONDOWN:
+            elif event_type == _VIDEOEXPOSE:
+                # Window contents may have been lost, redraw everything
+                self._last_rects = None
+                self._game_over_drawn = False
+            elif event_type == _MOUSEBUTTONDOWN:
                 if self.game_over:
                     # Check for Try Again button click
-                    mouse_pos = pygame.mouse.get_pos()
+                    mouse_pos = _mouse_pos()
                     if self.try_again_rect.collidepoint(mouse_pos):
                         self.init_game()  # Reset the game
                     elif self.quit_rect.collidepoint(mouse_pos):
                         self.running = False
                 elif event.button == 3:  # Right mouse button (when game is active)
                     self.player.aiming = True
-            elif event.type == pygame.MOUSEBUTTONUP:
+            elif event_type == _MOUSEBUTTONUP:
                 if not self.game_over and event.button == 3 and self.player.aiming:
                     self.player.aiming = False
                     self.player.start_shooting()
 
         if not self.game_over:
             # Get mouse position for aiming
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = _mouse_pos()
             self.player.update_aim(mouse_pos)
 
     def update(self):
@@ -108,6 +150,11 @@ class Game:
         if self.game_over:
             return
 
+        # Bind values used by the per-bullet loops below to locals
+        width = self.width
+        height = self.height
+        find_hit = self.find_hit
+
         # Update hit notification
         if self.show_hit_notification:
             self.hit_notification_timer -= 1
@@ -115,17 +162,11 @@ class Game:
                 self.show_hit_notification = False
 
         # Get player movement for this frame
-        keys = pygame.key.get_pressed()
-        player_dx, player_dy = 0, 0
-
-        if keys[pygame.K_w]:
-            player_dy -= self.player.speed
-        if keys[pygame.K_s]:
-            player_dy += self.player.speed
-        if keys[pygame.K_a]:
-            player_dx -= self.player.speed
-        if keys[pygame.K_d]:
-            player_dx += self.player.speed
+        # Pressed keys read as 0/1, so opposite keys cancel without branching
+        keys = _get_pressed()
+        speed = self.player.speed
+        player_dx = (keys[_K_D] - keys[_K_A]) * speed
+        player_dy = (keys[_K_S] - keys[_K_W]) * speed
 
         # Apply movement with screen bounds checking
         self.player.move(player_dx, player_dy, self.width, self.height)
@@ -135,61 +176,96 @@ class Game:
 
         # Update player shooting state
         if self.player.shooting:
-            self.player.update_shooting(self.player_bullets, self.width, self.height)
-
-        # Update player bullets
-        for bullet in self.player_bullets[:]:
-            bullet.update(self.width, self.height)
-            if not bullet.active:
-                self.player_bullets.remove(bullet)
-                continue
-
-            # Check collision with enemy
-            dx = bullet.x - self.enemy.x
-            dy = bullet.y - self.enemy.y
-            distance = (dx * dx + dy * dy) ** 0.5
-
-            if distance < self.enemy.radius:
-                # Hit enemy
-                is_dead = self.enemy.take_damage(self.player_bullet_damage)
-                bullet.active = False
-                self.player_bullets.remove(bullet)
-
-                # Respawn enemy if dead
-                if is_dead:
-                    self.respawn_enemy()
+            self.player.update_shooting(self.bullets, self.width, self.height)
 
         # Update enemy and its movement
         self.enemy.move_towards_target(self.width, self.height)
 
         # Update enemy state
-        self.enemy.update(self.enemy_bullets, self.width, self.height)
+        self.enemy.update(self.bullets, self.width, self.height)
+
+        # Nothing left to move or collide between bursts
+        bullets = self.bullets
+        if not bullets:
+            return
 
-        # Update enemy bullets
-        for bullet in self.enemy_bullets[:]:
-            bullet.update(self.width, self.height)
-            if not bullet.active:
-                self.enemy_bullets.remove(bullet)
+        # Targets as (entity, squared radius) pairs and hit counts, indexed by
+        # the team that fired: player bullets hit enemies, enemy bullets hit the player
+        targets = (
+            [(self.enemy, self.enemy.radius * self.enemy.radius)],
+            [(self.player, self.player.radius * self.player.radius)]
+        )
+        hits = ({}, {})
+
+        # Bucket the targets only when the grid is worth building
+        use_grid = (COLLISION_BACKEND == 'grid' or
+                    COLLISION_BACKEND == 'auto' and len(bullets) > GRID_MIN_BULLETS)
+        grids = self._grids
+        if use_grid:
+            for grid, team_targets in zip(grids, targets):
+                grid.clear()
+                for entry in team_targets:
+                    entity = entry[0]
+                    grid.insert(entity.x, entity.y, entity.radius, entry)
+
+        # Update all bullets in one sweep, compacting survivors in place
+        write = 0
+        for read in range(len(bullets)):
+            bullet = bullets[read]
+            if not bullet.update(width, height):
+                bullet.release()
+                continue
+
+            # Check collision with opposing entities, narrowed to the bullet's grid cell
+            if use_grid:
+                candidates = grids[bullet.team].query(bullet.x, bullet.y)
+            else:
+                candidates = targets[bullet.team]
+            target = find_hit(candidates, bullet) if candidates else None
+            if target is not None:
+                # Count the hit, damage is applied once after the sweep
+                team_hits = hits[bullet.team]
+                team_hits[target] = team_hits.get(target, 0) + 1
+                bullet.release()
                 continue
 
-            # Check collision with player
-            dx = bullet.x - self.player.x
-            dy = bullet.y - self.player.y
-            distance = (dx * dx + dy * dy) ** 0.5
+            bullets[write] = bullet
+            write += 1
+        del bullets[write:]
+
+        # Hit enemies, respawning any that died
+        for enemy, count in hits[PLAYER_TEAM].items():
+            if enemy.take_damage(self.player_bullet_damage * count):
+                self.respawn_enemy()
 
-            if distance < self.player.radius:
-                # Hit player
-                is_dead = self.player.take_damage(self.enemy_bullet_damage)
-                bullet.active = False
-                self.enemy_bullets.remove(bullet)
+        # Hit player
+        for player, count in hits[ENEMY_TEAM].items():
+            is_dead = player.take_damage(self.enemy_bullet_damage * count)
 
-                # Show hit notification
-                self.show_hit_notification = True
-                self.hit_notification_timer = self.hit_notification_duration
+            # Show hit notification
+            self.show_hit_notification = True
+            self.hit_notification_timer = self.hit_notification_duration
 
-                # Check if player is dead
-                if is_dead:
-                    self.game_over = True
+            # Check if player is dead
+            if is_dead:
+                self.game_over = True
+
+    def find_hit(self, candidates, bullet):
+        """
+        Return the first of the candidate entities that the bullet overlaps.
+
+        Args:
+            candidates (list): (entity, squared radius) pairs to test against
+            bullet (Bullet): Bullet to test
+        """
+        x = bullet.x
+        y = bullet.y
+        for entity, radius_sq in candidates:
+            dx = x - entity.x
+            dy = y - entity.y
+            if dx * dx + dy * dy < radius_sq:
+                return entity
+        return None
 
     def respawn_enemy(self):
         """Respawn the enemy at a random position."""
@@ -198,59 +274,98 @@ class Game:
 
         # Find a position away from the player
         min_distance = 300  # Minimum distance from player
+        min_distance_sq = min_distance * min_distance
+        max_attempts = 32  # Bound on rejection sampling
 
-        while True:
-            x = random.randint(self.enemy.radius, self.width - self.enemy.radius)
-            y = random.randint(self.enemy.radius, self.height - self.enemy.radius)
+        radius = self.enemy.radius
+        player_x = self.player.x
+        player_y = self.player.y
 
-            dx = x - self.player.x
-            dy = y - self.player.y
-            distance = (dx * dx + dy * dy) ** 0.5
+        # Sample until a position is far enough, keeping the farthest one seen
+        # so a cramped screen can't stall the frame
+        best_x, best_y, best_distance_sq = None, None, -1
+        for _ in range(max_attempts):
+            x = random.randint(radius, self.width - radius)
+            y = random.randint(radius, self.height - radius)
 
-            if distance >= min_distance:
-                self.enemy.x = x
-                self.enemy.y = y
-                break
+            dx = x - player_x
+            dy = y - player_y
+            distance_sq = dx * dx + dy * dy
+
+            if distance_sq > best_distance_sq:
+                best_x, best_y, best_distance_sq = x, y, distance_sq
+                if distance_sq >= min_distance_sq:
+                    break
+
+        self.enemy.x = best_x
+        self.enemy.y = best_y
 
     def render(self):
         """Render the game screen."""
-        # Clear the screen
-        self.screen.fill(self.bg_color)
-
         if self.game_over:
-            self.render_game_over()
-        else:
-            self.render_gameplay()
+            # Nothing on the game over screen changes, draw and present it once
+            if not self._game_over_drawn:
+                self.screen.fill(self.bg_color)
+                self.render_game_over()
+                pygame.display.flip()
+                self._game_over_drawn = True
+
+            # Gameplay needs a full redraw once it resumes
+            self._last_rects = None
+            return
 
-        # Update the display
-        pygame.display.flip()
+        # Dirty rects only pay off while they cover a small part of the window
+        dirty_limit = self.width * self.height * self.dirty_area_fraction
 
-    def render_gameplay(self):
-        """Render the main gameplay elements."""
-        # Draw player bullets
-        for bullet in self.player_bullets:
-            bullet.draw(self.screen)
+        if self._last_rects is None or self._last_area > dirty_limit:
+            # Nothing to erase incrementally or too much of it, clear the whole screen
+            self.screen.fill(self.bg_color)
+            rects = self.render_gameplay()
+            area = sum(rect.w * rect.h for rect in rects)
+            pygame.display.flip()
+        else:
+            # Erase only what was drawn last frame
+            for rect in self._last_rects:
+                self.screen.fill(self.bg_color, rect)
+            rects = self.render_gameplay()
+            area = sum(rect.w * rect.h for rect in rects)
+
+            # Present both the erased and the newly drawn areas, or the whole
+            # window if that is the larger share of it
+            if self._last_area + area > dirty_limit:
+                pygame.display.flip()
+            else:
+                pygame.display.update(self._last_rects + rects)
+
+        self._last_rects = rects
+        self._last_area = area
 
-        # Draw enemy bullets
-        for bullet in self.enemy_bullets:
-            bullet.draw(self.screen)
+    def render_gameplay(self):
+        """
+        Render the main gameplay elements.
+        Returns the list of screen rects that were drawn to.
+        """
+        # Draw all bullets in a single batched blit
+        rects = self.screen.blits([bullet.get_blit_args() for bullet in self.bullets])
 
         # Draw the enemy
-        self.enemy.draw(self.screen)
+        rects.append(self.enemy.draw(self.screen))
 
         # Draw the player
-        self.player.draw(self.screen)
+        rects.append(self.player.draw(self.screen))
 
         # Draw hit notification if active
         if self.show_hit_notification:
-            hit_text = self.font.render("Hit!", True, (255, 0, 0))
+            hit_text = self._hit_surf
             text_rect = hit_text.get_rect(center=(self.width // 2, self.height // 4))
-            self.screen.blit(hit_text, text_rect)
+            rects.append(self.screen.blit(hit_text, text_rect))
+
+        return rects
 
     def render_game_over(self):
         """Render the game over screen."""
         # Game over text
-        game_over_text = self.big_font.render("GAME OVER", True, (255, 0, 0))
+        game_over_text = self._go_surf
         go_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 3))
         self.screen.blit(game_over_text, go_rect)
 
@@ -269,7 +384,7 @@ class Game:
         self.try_again_rect = try_again_button
         pygame.draw.rect(self.screen, (0, 200, 0), try_again_button)
         pygame.draw.rect(self.screen, (0, 100, 0), try_again_button, 3)
-        try_text = self.font.render("Try Again", True, (255, 255, 255))
+        try_text = self._try_surf
         try_text_rect = try_text.get_rect(center=try_again_button.center)
         self.screen.blit(try_text, try_text_rect)
 
@@ -283,12 +398,16 @@ class Game:
         self.quit_rect = quit_button
         pygame.draw.rect(self.screen, (200, 0, 0), quit_button)
         pygame.draw.rect(self.screen, (100, 0, 0), quit_button, 3)
-        quit_text = self.font.render("Quit", True, (255, 255, 255))
+        quit_text = self._quit_surf
         quit_text_rect = quit_text.get_rect(center=quit_button.center)
         self.screen.blit(quit_text, quit_text_rect)
 
     def run(self):
         """Main game loop."""
+        # Game objects hold no reference cycles and bullets are pooled, so the
+        # cyclic collector has nothing to reclaim and would only cause pauses
+        gc.disable()
+
         while self.running:
             # Handle events
             self.handle_events()
@@ -0,0 +1,62 @@
+class UniformGrid:
+    def __init__(self, width, height, cell_size=64):
+        """
+        Create a collision broad-phase grid covering the screen.
+        Cells are kept in a flat list and indexed arithmetically.
+
+        Args:
+            width (int): Width of the covered area
+            height (int): Height of the covered area
+            cell_size (int): Side length of a square cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cols = width // cell_size + 1
+        self.rows = height // cell_size + 1
+        self.cells = [[] for _ in range(self.cols * self.rows)]
+        self.used = []  # Indices of non-empty cells, so clear() only touches those
+
+    def clear(self):
+        """Empty every cell that holds something."""
+        cells = self.cells
+        for index in self.used:
+            cells[index].clear()
+        self.used.clear()
+
+    def insert(self, x, y, radius, obj):
+        """
+        Add an object to every cell its bounding box overlaps.
+
+        Args:
+            x (float): Center x position
+            y (float): Center y position
+            radius (float): Half the side of the bounding box
+            obj: Object to store
+        """
+        cell = self.cell_size
+        min_cx = max(0, int((x - radius) // cell))
+        max_cx = min(self.cols - 1, int((x + radius) // cell))
+        min_cy = max(0, int((y - radius) // cell))
+        max_cy = min(self.rows - 1, int((y + radius) // cell))
+
+        cells = self.cells
+        for cy in range(min_cy, max_cy + 1):
+            row = cy * self.cols
+            for cx in range(min_cx, max_cx + 1):
+                bucket = cells[row + cx]
+                if not bucket:
+                    self.used.append(row + cx)
+                bucket.append(obj)
+
+    def query(self, x, y):
+        """
+        Return the objects stored in the cell containing a point.
+
+        Args:
+            x (float): Point x position
+            y (float): Point y position
+        """
+        cx = int(x // self.cell_size)
+        cy = int(y // self.cell_size)
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return self.cells[cy * self.cols + cx]
+        return ()
@@ -2,10 +2,20 @@ import pygame
 import math
 import random
 from collections import deque
-from bullet import Bullet
+from bullet import Bullet, PLAYER_TEAM
 
 
 class Player:
+    __slots__ = (
+        'x', 'y', 'radius', 'color', 'speed', 'aiming', 'aim_direction',
+        '_indicator_key', '_indicator_points',
+        'shooting', 'bullets_to_fire', 'bullet_queue', '_shot_frame',
+        'max_ammo', 'ammo', 'ammo_recharge_rate', 'is_recharging', '_total_ammo', '_has_full',
+        'bullet_count', 'bullet_delay', 'bullet_speed', 'bullet_size', 'bullet_color',
+        'bullet_spread', 'column_offset', '_stagger',
+        'max_health', 'health', 'indicator_length'
+    )
+
     def __init__(self, x, y, radius, color, speed):
         """
         Initialize the player circle.
@@ -24,17 +34,22 @@ class Player:
         self.speed = speed
         self.aiming = False
         self.aim_direction = (1, 0)  # Default direction (right)
+        self._indicator_key = None  # (x, y, aim direction) the indicator corners were computed for
+        self._indicator_points = None
 
         # Shooting properties
         self.shooting = False
         self.bullets_to_fire = 0
-        self.bullet_queue = deque()
+        self.bullet_queue = deque()  # (fire frame, direction, offset x, offset y), in firing order
+        self._shot_frame = 0  # Frames since the current burst started
 
         # Ammo System
         self.max_ammo = 3
         self.ammo = [1.0, 1.0, 1.0]  # Start with full ammo
         self.ammo_recharge_rate = 0.005  # Amount recharged per frame
         self.is_recharging = True
+        self._total_ammo = sum(self.ammo)  # Running total, kept in sync with self.ammo
+        self._has_full = True  # Whether any segment is fully charged
 
         # ----- BULLET CONFIGURATION -----
         # You can edit these values to change bullet behavior
@@ -43,9 +58,18 @@ class Player:
         self.bullet_speed = 10  # Speed of bullets
         self.bullet_size = (20, 8)  # Size of bullets (width, height)
         self.bullet_color = (0, 0, 255)  # Bullet color (blue)
-        self.bullet_spread = 0 # Random spread factor (0 = no spread, higher = more spread)
+        self.bullet_spread = 0 # Random spread factor, sine of the max spread angle (0 = no spread, 1 = up to 90 degrees)
         self.column_offset = 15  # Distance between left and right columns
 
+        # Burst pattern as (column offset factor, fire delay) per bullet, creating a
+        # staggered pattern in two columns like Colt in Brawlstars: even indices go
+        # to the left column, odd to the right one, half a delay later
+        self._stagger = tuple(
+            (-0.5, self.bullet_delay * (i // 2)) if i % 2 == 0
+            else (0.5, self.bullet_delay * (i // 2) + self.bullet_delay // 2)
+            for i in range(self.bullet_count)
+        )
+
         # Health System
         self.max_health = 3
         self.health = 3
@@ -63,15 +87,11 @@ class Player:
             screen_width (int): Width of the game screen
             screen_height (int): Height of the game screen
         """
-        # Calculate new position
-        new_x = self.x + dx
-        new_y = self.y + dy
-
-        # Keep player within screen bounds
-        if new_x - self.radius >= 0 and new_x + self.radius <= screen_width:
-            self.x = new_x
-        if new_y - self.radius >= 0 and new_y + self.radius <= screen_height:
-            self.y = new_y
+        # Clamp the new position to the screen bounds, so the player slides
+        # along a wall instead of stopping short of it
+        radius = self.radius
+        self.x = max(radius, min(screen_width - radius, self.x + dx))
+        self.y = max(radius, min(screen_height - radius, self.y + dy))
 
     def update_aim(self, mouse_pos):
         """
@@ -85,16 +105,14 @@ class Player:
         dy = mouse_pos[1] - self.y
 
         # Normalize the direction vector (make it length 1)
-        length = math.sqrt(dx ** 2 + dy ** 2)
+        length = math.hypot(dx, dy)
         if length > 0:  # Avoid division by zero
-            self.aim_direction = (dx / length, dy / length)
+            inv_length = 1.0 / length
+            self.aim_direction = (dx * inv_length, dy * inv_length)
 
     def has_ammo(self):
         """Check if player has any ammo available."""
-        for ammo in self.ammo:
-            if ammo >= 1.0:
-                return True
-        return False
+        return self._has_full
 
     def consume_ammo(self):
         """
@@ -102,8 +120,7 @@ class Player:
         Returns True if successful, False if no ammo.
         """
         # Check if we have enough ammo to shoot (at least one full segment)
-        total_ammo = sum(self.ammo)
-        if total_ammo < 1.0:
+        if self._total_ammo < 1.0:
             return False
 
         # Find rightmost ammo with any charge
@@ -119,6 +136,7 @@ class Player:
         # If the rightmost ammo is full, just consume it
         if self.ammo[rightmost_index] >= 1.0:
             self.ammo[rightmost_index] = 0.0
+            self._sync_ammo_state()
             return True
 
         # Otherwise, we need to consume from multiple segments
@@ -138,8 +156,14 @@ class Player:
                     remaining_to_consume -= self.ammo[i]
                     self.ammo[i] = 0.0
 
+        self._sync_ammo_state()
         return True
 
+    def _sync_ammo_state(self):
+        """Recompute the cached ammo total and full-segment flag from self.ammo."""
+        self._total_ammo = sum(self.ammo)
+        self._has_full = any(ammo >= 1.0 for ammo in self.ammo)
+
     def update_ammo(self):
         """Update ammo recharge."""
         if not self.is_recharging:
@@ -148,9 +172,12 @@ class Player:
         # Recharge ammo sequentially (still left to right)
         for i in range(len(self.ammo)):
             if self.ammo[i] < 1.0:
+                old_ammo = self.ammo[i]
                 self.ammo[i] += self.ammo_recharge_rate
-                if self.ammo[i] > 1.0:
+                if self.ammo[i] >= 1.0:
                     self.ammo[i] = 1.0
+                    self._has_full = True
+                self._total_ammo += self.ammo[i] - old_ammo
                 break  # Only recharge one slot at a time
 
     def start_shooting(self):
@@ -166,43 +193,41 @@ class Player:
         self.shooting = True
         self.bullets_to_fire = self.bullet_count
         self.is_recharging = False  # Stop recharging while shooting
+        self._shot_frame = 0
 
         # Calculate perpendicular vector for column positioning
-        perp_x = -self.aim_direction[1]
-        perp_y = self.aim_direction[0]
+        aim_x, aim_y = self.aim_direction
+        perp_x = -aim_y
+        perp_y = aim_x
+
+        # Spread is applied as a rotation of the aim direction, which keeps
+        # every bullet direction unit length without renormalizing
+        max_angle = math.asin(min(self.bullet_spread, 1.0))
+        angle_range = 2.0 * max_angle
+        rand = random.random
 
         # Pre-calculate all bullet directions for consistent trajectory
-        # Creating a staggered pattern in two columns like Colt in Brawlstars
-        for i in range(self.bullet_count):
+        column_offset = self.column_offset
+        for offset_factor, column_delay in self._stagger:
             # Apply random spread to direction
             # ----- BULLET SPREAD CONFIGURATION -----
             # Modify bullet_spread above to change the amount of spread
-            spread_x = random.uniform(-self.bullet_spread, self.bullet_spread)
-            spread_y = random.uniform(-self.bullet_spread, self.bullet_spread)
-
-            # Normalize the direction vector after adding spread
-            dir_x = self.aim_direction[0] + spread_x
-            dir_y = self.aim_direction[1] + spread_y
-            length = math.sqrt(dir_x ** 2 + dir_y ** 2)
-            bullet_dir = (dir_x / length, dir_y / length)
-
-            # Determine if this bullet is in the left or right column (alternating)
-            # Even indices go to left column, odd to right column
-            is_left_column = (i % 2 == 0)
+            if max_angle:
+                angle = rand() * angle_range - max_angle
+                cos_a = math.cos(angle)
+                sin_a = math.sin(angle)
+                bullet_dir = (aim_x * cos_a - aim_y * sin_a, aim_x * sin_a + aim_y * cos_a)
+            else:
+                # Without spread every bullet simply follows the aim
+                bullet_dir = self.aim_direction
 
             # Calculate offset based on column
-            offset_factor = -0.5 if is_left_column else 0.5
-            offset_x = perp_x * self.column_offset * offset_factor
-            offset_y = perp_y * self.column_offset * offset_factor
-
-            # Calculate delay: stagger left and right columns
-            # Each column fires at twice the delay rate, with the right column delayed by half the interval
-            column_delay = self.bullet_delay * (i // 2)  # Integer division to group by pairs
-            if not is_left_column:
-                column_delay += self.bullet_delay // 2  # Half delay offset for right column
+            offset_x = perp_x * column_offset * offset_factor
+            offset_y = perp_y * column_offset * offset_factor
 
-            # Add to queue with position offset and delay counter
-            self.bullet_queue.append((bullet_dir, column_delay, offset_x, offset_y))
+            # Add to queue with the burst frame it fires on and its position offset.
+            # Delays never decrease along the burst, so the queue stays in firing order
+            self.bullet_queue.append((column_delay, bullet_dir, offset_x, offset_y))
 
     def update_shooting(self, bullets, screen_width, screen_height):
         """
@@ -213,66 +238,68 @@ class Player:
             screen_width (int): Width of the game screen
             screen_height (int): Height of the game screen
         """
-        # Process bullet queue
-        to_remove = []
-        for i, (bullet_dir, delay, offset_x, offset_y) in enumerate(self.bullet_queue):
-            if delay <= 0:
-                # Create the bullet with column offset
-                # ----- BULLET CREATION CONFIGURATION -----
-                # Modify bullet_size, bullet_speed, and bullet_color above
-                # to change the appearance and behavior of bullets
-                start_x = self.x + offset_x
-                start_y = self.y + offset_y
-
-                new_bullet = Bullet(
-                    start_x,
-                    start_y,
-                    bullet_dir,
-                    self.bullet_speed,
-                    self.bullet_size,
-                    self.bullet_color,
-                    self.indicator_length  # Pass the max distance to match indicator length
-                )
-                bullets.append(new_bullet)
-                to_remove.append(i)
-            else:
-                # Decrease delay counter
-                self.bullet_queue[i] = (bullet_dir, delay - 1, offset_x, offset_y)
-
-        # Remove processed bullets from queue
-        # Convert to list, modify, then convert back to deque (since deque doesn't support pop with index)
-        queue_list = list(self.bullet_queue)
-        for i in sorted(to_remove, reverse=True):
-            queue_list.pop(i)
-        self.bullet_queue = deque(queue_list)
+        # Bind hot attributes and methods to locals for the loop
+        queue = self.bullet_queue
+        queue_popleft = queue.popleft
+        bullets_append = bullets.append
+        frame = self._shot_frame
+        x = self.x
+        y = self.y
+
+        # Fire every queued bullet whose frame has come; the rest of the queue
+        # is untouched since it is ordered by fire frame
+        while queue and queue[0][0] <= frame:
+            _, bullet_dir, offset_x, offset_y = queue_popleft()
+
+            # Create the bullet with column offset
+            # ----- BULLET CREATION CONFIGURATION -----
+            # Modify bullet_size, bullet_speed, and bullet_color above
+            # to change the appearance and behavior of bullets
+            new_bullet = Bullet.spawn(
+                x + offset_x,
+                y + offset_y,
+                bullet_dir,
+                self.bullet_speed,
+                self.bullet_size,
+                self.bullet_color,
+                self.indicator_length,  # Pass the max distance to match indicator length
+                PLAYER_TEAM
+            )
+            bullets_append(new_bullet)
+
+        self._shot_frame = frame + 1
 
         # Check if shooting is complete
-        if len(self.bullet_queue) == 0:
+        if not queue:
             self.shooting = False
             self.is_recharging = True  # Start recharging again
 
     def draw(self, screen):
         """
         Draw the player circle on the screen.
+        Returns the bounding rect of everything drawn.
 
         Args:
             screen: Pygame surface to draw on
         """
-        pygame.draw.circle(screen, self.color, (self.x, self.y), self.radius)
+        dirty = pygame.draw.circle(screen, self.color, (self.x, self.y), self.radius)
 
         # Draw aim indicator if aiming
         if self.aiming:
-            self.draw_aim_indicator(screen)
+            dirty.union_ip(self.draw_aim_indicator(screen))
 
         # Draw ammo bars
-        self.draw_ammo_bars(screen)
+        dirty.union_ip(self.draw_ammo_bars(screen))
 
         # Draw health bar
-        self.draw_health_bar(screen)
+        dirty.union_ip(self.draw_health_bar(screen))
+
+        return dirty
 
     def draw_health_bar(self, screen):
         """
         Draw health bar above the player.
+        Returns the bar's rect.
 
         Args:
             screen: Pygame surface to draw on
@@ -291,13 +318,15 @@ class Player:
         bar_y = self.y - self.radius - bar_offset_y
 
         # Draw background
-        pygame.draw.rect(screen, background_color, (bar_x, bar_y, bar_width, bar_height))
+        bar_rect = pygame.draw.rect(screen, background_color, (bar_x, bar_y, bar_width, bar_height))
 
         # Draw filled portion based on health percentage
         health_width = int(bar_width * (self.health / self.max_health))
         if health_width > 0:
             pygame.draw.rect(screen, health_color, (bar_x, bar_y, health_width, bar_height))
 
+        return bar_rect
+
     def take_damage(self, damage):
         """Apply damage to the player."""
         self.health -= damage
@@ -307,6 +336,7 @@ class Player:
     def draw_aim_indicator(self, screen):
         """
         Draw the rectangular aim indicator when right-clicking.
+        Returns the indicator's bounding rect.
 
         Args:
             screen: Pygame surface to draw on
@@ -319,29 +349,37 @@ class Player:
         # Store the indicator length for bullet max distance
         self.indicator_length = indicator_length
 
-        # Calculate the endpoint of the indicator
-        end_x = self.x + self.aim_direction[0] * indicator_length
-        end_y = self.y + self.aim_direction[1] * indicator_length
-
-        # Calculate the perpendicular vector for width
-        perp_x = -self.aim_direction[1]
-        perp_y = self.aim_direction[0]
-
-        # Calculate the four corners of the rectangle
-        half_width = indicator_width / 2
-        points = [
-            (self.x + perp_x * half_width, self.y + perp_y * half_width),
-            (self.x - perp_x * half_width, self.y - perp_y * half_width),
-            (end_x - perp_x * half_width, end_y - perp_y * half_width),
-            (end_x + perp_x * half_width, end_y + perp_y * half_width)
-        ]
+        # Reuse the corners while neither the player nor the aim has moved
+        indicator_key = (self.x, self.y, self.aim_direction)
+        if indicator_key == self._indicator_key:
+            points = self._indicator_points
+        else:
+            # Calculate the endpoint of the indicator
+            end_x = self.x + self.aim_direction[0] * indicator_length
+            end_y = self.y + self.aim_direction[1] * indicator_length
+
+            # Calculate the perpendicular vector for width
+            perp_x = -self.aim_direction[1]
+            perp_y = self.aim_direction[0]
+
+            # Calculate the four corners of the rectangle
+            half_width = indicator_width / 2
+            points = (
+                (self.x + perp_x * half_width, self.y + perp_y * half_width),
+                (self.x - perp_x * half_width, self.y - perp_y * half_width),
+                (end_x - perp_x * half_width, end_y - perp_y * half_width),
+                (end_x + perp_x * half_width, end_y + perp_y * half_width)
+            )
+            self._indicator_key = indicator_key
+            self._indicator_points = points
 
         # Draw the rectangle
-        pygame.draw.polygon(screen, indicator_color, points)
+        return pygame.draw.polygon(screen, indicator_color, points)
 
     def draw_ammo_bars(self, screen):
         """
         Draw ammo bars below the player.
+        Returns the bounding rect of all bars.
 
         Args:
             screen: Pygame surface to draw on
@@ -361,15 +399,22 @@ class Player:
         start_x = self.x - total_width / 2
 
         # Draw each ammo bar
+        dirty = None
         for i, ammo in enumerate(self.ammo):
             # Bar position
             bar_x = start_x + i * (bar_width + bar_spacing)
             bar_y = self.y + self.radius + bar_offset_y
 
             # Draw empty bar background
-            pygame.draw.rect(screen, empty_color, (bar_x, bar_y, bar_width, bar_height))
+            bar_rect = pygame.draw.rect(screen, empty_color, (bar_x, bar_y, bar_width, bar_height))
+            if dirty is None:
+                dirty = bar_rect
+            else:
+                dirty.union_ip(bar_rect)
 
             # Draw filled portion
             fill_width = int(bar_width * ammo)
             if fill_width > 0:
-                pygame.draw.rect(screen, filled_color, (bar_x, bar_y, fill_width, bar_height))
\ No newline at end of file
+                pygame.draw.rect(screen, filled_color, (bar_x, bar_y, fill_width, bar_height))
+
+        return dirty